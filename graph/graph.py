@@ -1,57 +1,259 @@
 # G = (V, E)
+import importlib.util
+import sys
 from collections import namedtuple
-from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache, lru_cache, wraps
+from pathlib import Path
 
-from pyvis.network import Network
+import numpy as np
+from scipy.sparse import coo_matrix
 
-Graph = namedtuple("Graph", ["nodes", "edges", "is_directed"])
+def _readonly(*arrays):
+    """Mark shared or cached arrays as read-only so callers cannot corrupt them."""
+    for array in arrays:
+        array.setflags(write=False)
 
-nodes = range(4)
-edges = [
-    (0, 1), 
-    (0, 1), 
-    (0, 2), 
-    (0, 2), 
-    (0, 3), 
-    (1, 3), 
-    (2, 3)]
+def _as_edge_array(edges):
+    """
+    Return 'edges' as an owned, read-only int32 array, copying it
+    unless it already is one so callers can't mutate a Graph's edges.
+    """
+    if (isinstance(edges, np.ndarray) and edges.dtype == np.int32
+            and not edges.flags.writeable and edges.base is None):
+        return edges
+    array = np.array(edges, dtype=np.int32)
+    _readonly(array)
+    return array
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Graph:
+    """
+    A graph whose edges are stored as two parallel read-only int32
+    arrays (edges_src[i], edges_dst[i]).
+
+    Graphs are immutable; derived structures such as the CSR arrays
+    are built lazily and cached on the instance.
+    """
+    nodes: range
+    edges_src: np.ndarray
+    edges_dst: np.ndarray
+    is_directed: bool
+    _cache: dict = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "edges_src", _as_edge_array(self.edges_src))
+        object.__setattr__(self, "edges_dst", _as_edge_array(self.edges_dst))
+
+    def __getstate__(self):
+        # The cache is rebuilt on demand, so it isn't pickled.
+        return self.nodes, self.edges_src, self.edges_dst, self.is_directed
+
+    def __setstate__(self, state):
+        nodes, edges_src, edges_dst, is_directed = state
+        _readonly(edges_src, edges_dst)
+        object.__setattr__(self, "nodes", nodes)
+        object.__setattr__(self, "edges_src", edges_src)
+        object.__setattr__(self, "edges_dst", edges_dst)
+        object.__setattr__(self, "is_directed", is_directed)
+        object.__setattr__(self, "_cache", {})
+
+    @property
+    def csr(self):
+        """The cached (indptr, indices) CSR arrays of the graph."""
+        return to_csr(self)
+
+    @property
+    def out_degree(self):
+        """
+        The cached out degree array of the graph, which is
+        the degree array if the graph is undirected.
+        """
+        return _degrees(self)
+
+DegreeCentrality = namedtuple(
+    "DegreeCentrality", ["out_degrees", "in_degrees", "total_degrees"]
+)
+DegreeStats = namedtuple("DegreeStats", ["min", "max", "sum", "mean"])
+
+# Below this many edges the Numba kernel's dispatch overhead isn't worth it.
+_NUMBA_MIN_EDGES = 100_000
+# Above this fraction of filled cells a flat bincount beats np.add.at.
+_BINCOUNT_MIN_DENSITY = 0.01
+
+def _memoized(func):
+    """
+    Cache the result of 'func(graph)' on the Graph instance itself.
+
+    Graphs are immutable, so a cached result stays valid for as long
+    as the graph lives and is freed together with it. Results are keyed
+    by the function's qualified name rather than the function object,
+    which keeps graphs with a warm cache picklable.
+    """
+    key = func.__qualname__
+
+    @wraps(func)
+    def wrapper(graph):
+        cache = graph._cache
+        if key not in cache:
+            cache[key] = func(graph)
+        return cache[key]
+    return wrapper
+
+def _edge_arrays(graph):
+    """
+    Return the (src, dst) edge arrays of the graph, with every
+    edge listed in both directions if the graph is undirected.
+    """
+    src, dst = graph.edges_src, graph.edges_dst
+    if not graph.is_directed:
+        # Interleave each edge with its reverse so neighbor lists keep
+        # the order in which the edges were given.
+        src, dst = (
+            np.column_stack((src, dst)).ravel(),
+            np.column_stack((dst, src)).ravel(),
+        )
+    return src, dst
 
-G = Graph(nodes, edges, True)
+@_memoized
+def to_csr(graph):
+    """
+    Returns the CSR representation (indptr, indices) of the graph:
+    the neighbors of node v are indices[indptr[v]:indptr[v + 1]].
+    The arrays are cached per graph and are read-only.
+
+    Assumes that graph.nodes is equivalent to range(len(graph.nodes)).
+    """
+    src, dst = _edge_arrays(graph)
+    counts = np.bincount(src, minlength=len(graph.nodes))
+    indptr = np.concatenate(([0], counts.cumsum()))
+    indices = dst[np.argsort(src, kind="stable")]
+    _readonly(indptr, indices)
+    return indptr, indices
 
 def adjacency_dict(graph):
     """
     Returns the adjecency list representaiton of the graph.
     """
-    adj = {node: [] for node in graph.nodes}
-    for edge in graph.edges:
-        node1, node2 = edge[0], edge[1]
-        adj[node1].append(node2)
-        if not graph.is_directed:
-            adj[node2].append(node1)
-    return adj
+    indptr, indices = to_csr(graph)
+    return {
+        node: indices[indptr[i]:indptr[i + 1]].tolist()
+        for i, node in enumerate(graph.nodes)
+    }
+
+@_memoized
+def _adjacency(graph):
+    """Return the cached CSR adjacency matrix of the graph."""
+    n = len(graph.nodes)
+    src, dst = _edge_arrays(graph)
+    data = np.ones(len(src), dtype=np.int32)
+    # Parallel edges are summed when the COO entries are converted to CSR.
+    return coo_matrix((data, (src, dst)), shape=(n, n)).tocsr()
+
+@cache
+def _load_fill_adjacency():
+    """
+    Return the Numba adjacency kernel from the utils_numba.py file next
+    to this module, or None if the file is missing or the optional numba
+    extra isn't installed.
+
+    The kernel is loaded by path, so it is found however this module was
+    imported, and only on first use, since importing numba is slow.
+    """
+    path = Path(__file__).with_name("utils_numba.py")
+    spec = importlib.util.spec_from_file_location("utils_numba", path)
+    module = importlib.util.module_from_spec(spec)
+    # Numba's on-disk cache looks the module up by name when reloading.
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+    except (ImportError, FileNotFoundError):
+        del sys.modules[spec.name]
+        return None
+    return module.fill_adjacency
+
+def _fill_directed(src, dst, n):
+    """Return the n x n matrix counting adj[src[i], dst[i]] for every edge i."""
+    if len(src) < _BINCOUNT_MIN_DENSITY * n * n:
+        adj = np.zeros((n, n), dtype=np.int32)
+        np.add.at(adj, (src, dst), 1)
+        return adj
+    # Counting flat cell indices sums parallel edges in a single pass.
+    counts = np.bincount(src.astype(np.int64) * n + dst, minlength=n * n)
+    return counts.astype(np.int32).reshape(n, n)
+
+def _fill_undirected(src, dst, n):
+    """
+    Return the n x n matrix counting both adj[src[i], dst[i]]
+    and adj[dst[i], src[i]] for every edge i.
+    """
+    return _fill_directed(
+        np.concatenate((src, dst)), np.concatenate((dst, src)), n
+    )
 
-def adjacency_matrix(graph):
+def adjacency_matrix(graph, dense=False, symmetric=True):
     """
-    Returns the adjecency matrix of the graph.
+    Returns the adjecency matrix of the graph as a scipy CSR matrix,
+    or as a dense NumPy array if 'dense' is True.
+
+    If the graph is undirected and 'symmetric' is False, each edge (u, v)
+    is only counted in adj[u, v]. adj + adj.T then gives the symmetric
+    matrix, and adj.sum(axis=0) + adj.sum(axis=1) gives the degrees.
     
     Assumes that graph.nodes is equivalent to range(len(graph.nodes)).
     """
-    adj = [[0 for node in graph.nodes] for node in graph.nodes]
-    for edge in graph.edges:
-        node1, node2 = edge[0], edge[1]
-        adj[node1][node2] += 1
-        if not graph.is_directed:
-            adj[node2][node1] += 1
-    return adj
+    n = len(graph.nodes)
+    if not (graph.is_directed or symmetric):
+        if not dense:
+            data = np.ones(len(graph.edges_src), dtype=np.int32)
+            edges = (graph.edges_src, graph.edges_dst)
+            return coo_matrix((data, edges), shape=(n, n)).tocsr()
+        return _fill_directed(graph.edges_src, graph.edges_dst, n)
+    if not dense:
+        return _adjacency(graph).copy()
+    if len(graph.edges_src) >= _NUMBA_MIN_EDGES:
+        fill_adjacency = _load_fill_adjacency()
+        if fill_adjacency is not None:
+            indptr, indices = to_csr(graph)
+            return fill_adjacency(indptr, indices, n)
+    fill = _fill_directed if graph.is_directed else _fill_undirected
+    return fill(graph.edges_src, graph.edges_dst, n)
+
+def adjacency_bitset(graph):
+    """
+    Returns the adjecency matrix of the graph packed into uint64 words:
+    node v is a neighbor of node u if bit (v & 63) of bits[u, v >> 6] is set.
+    Parallel edges collapse into a single bit.
+
+    Assumes that graph.nodes is equivalent to range(len(graph.nodes)).
+    """
+    n = len(graph.nodes)
+    src, dst = _edge_arrays(graph)
+    bits = np.zeros((n, (n + 63) // 64), dtype=np.uint64)
+    masks = np.left_shift(np.uint64(1), (dst & 63).astype(np.uint64))
+    np.bitwise_or.at(bits, (src, dst >> 6), masks)
+    return bits
+
+def bitset_degrees(bits):
+    """Return the number of distinct neighbors of each node in a bitset."""
+    return np.bitwise_count(bits).sum(axis=1)
+
+def common_neighbors(bits, node1, node2):
+    """Return the number of neighbors shared by two nodes in a bitset."""
+    return int(np.bitwise_count(bits[node1] & bits[node2]).sum())
 
 def show(graph, output_filename):
     """
     Saves a HTML file locally containing a visualization of the graph, 
     and returns a pyvis Network instance of the graph.
     """
+    # pyvis is only needed for visualization, so it isn't imported up front.
+    from pyvis.network import Network
+
     g = Network(directed=graph.is_directed)
     g.add_nodes(graph.nodes)
-    g.add_edges(graph.edges)
+    g.add_edges(list(zip(graph.edges_src.tolist(), graph.edges_dst.tolist())))
     g.show(output_filename, notebook=False)
     return g
 
@@ -60,22 +262,87 @@ def _validate_num_nodes(num_nodes):
     Check whether or not 'num_nodes' is a positive integer,
     and raises TypeError or ValueError if it's not.
     """
-    if not isinstance(num_nodes, int):
+    if type(num_nodes) is not int:
         raise TypeError(f"num_nodes must be an integer; {type(num_nodes)=}")
     if num_nodes < 1:
         raise ValueError(f"num_nodes must be positive; {num_nodes=}")
     
 
+def _path_edges(num_nodes):
+    """Return the (src, dst) edge arrays of a path in 'num_nodes' nodes."""
+    edges_src = np.arange(num_nodes - 1, dtype=np.int32)
+    return edges_src, edges_src + 1
+
+def _cycle_edges(num_nodes):
+    """Return the (src, dst) edge arrays of a cycle in 'num_nodes' nodes."""
+    edges_src = np.arange(num_nodes, dtype=np.int32)
+    edges_dst = edges_src + 1
+    edges_dst[-1] = 0
+    return edges_src, edges_dst
+
+def _complete_edges(num_nodes):
+    """Return the (src, dst) edge arrays of a complete graph in 'num_nodes' nodes."""
+    edges_src, edges_dst = np.triu_indices(num_nodes, k=1)
+    return edges_src.astype(np.int32), edges_dst.astype(np.int32)
+
+def _star_edges(num_nodes):
+    """Return the (src, dst) edge arrays of a star graph in 'num_nodes' nodes."""
+    edges_src = np.zeros(num_nodes - 1, dtype=np.int32)
+    return edges_src, np.arange(1, num_nodes, dtype=np.int32)
+
+_EDGE_BUILDERS = {
+    "path": _path_edges,
+    "cycle": _cycle_edges,
+    "complete": _complete_edges,
+    "star": _star_edges,
+}
+
+# Only graphs up to this many edges are cached, so the cache stays small.
+_EDGE_CACHE_MAX_EDGES = 100_000
+
+def _num_edges(kind, num_nodes):
+    """Return the number of edges of the 'kind' graph in 'num_nodes' nodes."""
+    if kind == "complete":
+        return num_nodes * (num_nodes - 1) // 2
+    if kind == "cycle":
+        return num_nodes
+    return num_nodes - 1
+
+def _build_edges(kind, num_nodes):
+    """
+    Validate 'num_nodes' and return read-only (src, dst) edge arrays
+    of the 'kind' graph in 'num_nodes' nodes.
+    """
+    _validate_num_nodes(num_nodes)
+    edges_src, edges_dst = _EDGE_BUILDERS[kind](num_nodes)
+    _readonly(edges_src, edges_dst)
+    return edges_src, edges_dst
+
+_cached_edges = lru_cache(maxsize=16)(_build_edges)
+
+def _edges_for(kind, num_nodes):
+    """
+    Return the read-only (src, dst) edge arrays of the 'kind' graph in
+    'num_nodes' nodes, served from a small cache for graphs with at most
+    _EDGE_CACHE_MAX_EDGES edges.
+
+    Only exact ints reach the cache, so arguments like 3.0 or True can't
+    hit the entry for 3 or 1 and skip validation.
+    """
+    if type(num_nodes) is not int:
+        return _build_edges(kind, num_nodes)
+    if _num_edges(kind, num_nodes) <= _EDGE_CACHE_MAX_EDGES:
+        return _cached_edges(kind, num_nodes)
+    return _build_edges(kind, num_nodes)
+
 def path_graph(num_nodes, is_directed=False):
     """
     Return a Graph instance representing
     a path in 'num_nodes' nodes.
     Can generate both directed and undirected graphs.
     """
-    _validate_num_nodes(num_nodes)
-    nodes = range(num_nodes)
-    edges = [(i, i+1) for i in range(num_nodes - 1)]
-    return Graph(nodes, edges, is_directed=is_directed)
+    edges_src, edges_dst = _edges_for("path", num_nodes)
+    return Graph(range(num_nodes), edges_src, edges_dst, is_directed=is_directed)
 
 def cycle_graph(num_nodes, is_directed=False):
     """
@@ -83,9 +350,8 @@ def cycle_graph(num_nodes, is_directed=False):
     a cycle in 'num_nodes' nodes.
     Can generate both directed and undirected graphs.
     """
-    base_path = path_graph(num_nodes, is_directed)
-    base_path.edges.append((num_nodes -1, 0))
-    return base_path
+    edges_src, edges_dst = _edges_for("cycle", num_nodes)
+    return Graph(range(num_nodes), edges_src, edges_dst, is_directed=is_directed)
 
 def complete_graph(num_nodes):
     """
@@ -93,10 +359,8 @@ def complete_graph(num_nodes):
     a complete graph in 'num_nodes' nodes.
     Only undirected graphs.
     """
-    _validate_num_nodes(num_nodes)
-    nodes =  range(num_nodes)
-    edges = list(combinations(nodes, 2))
-    return Graph(nodes, edges, is_directed=False)
+    edges_src, edges_dst = _edges_for("complete", num_nodes)
+    return Graph(range(num_nodes), edges_src, edges_dst, is_directed=False)
 
 def star_graph(num_nodes):
     """
@@ -104,77 +368,187 @@ def star_graph(num_nodes):
     the star graph in 'num_nodes' nodes.
     Only undirected graphs.
     """
-    _validate_num_nodes(num_nodes)
-    nodes =  range(num_nodes)
-    edges = [(0, i) for i in range(1, num_nodes)]
-    return Graph(nodes, edges, is_directed=False)
+    edges_src, edges_dst = _edges_for("star", num_nodes)
+    return Graph(range(num_nodes), edges_src, edges_dst, is_directed=False)
+
+def _degree_dtype(graph):
+    """
+    Return the smallest unsigned dtype that can hold any degree of the graph.
 
+    Parallel edges and self-loops mean degrees are not bounded by n - 1,
+    but no degree can exceed twice the number of edges.
+    """
+    bound = 2 * len(graph.edges_src)
+    if bound <= np.iinfo(np.uint16).max:
+        return np.uint16
+    if bound <= np.iinfo(np.uint32).max:
+        return np.uint32
+    return np.uint64
+
+@_memoized
 def _degrees(graph):
-    """Return a dictionary of degrees for each node in the graph."""
-    adj_list = adjacency_dict(graph)
-    degrees = { 
-        node: len(neighbors) 
-        for node, neighbors in adj_list.items()
-    }
+    """
+    Return an array of degrees for each node in the graph,
+    which are the out degrees if the graph is directed.
+    """
+    n = len(graph.nodes)
+    degrees = np.bincount(graph.edges_src, minlength=n)
+    if not graph.is_directed:
+        degrees += np.bincount(graph.edges_dst, minlength=n)
+    degrees = degrees.astype(_degree_dtype(graph))
+    _readonly(degrees)
     return degrees
 
-def degrees(graph):
-    """Return a dictionary of degrees for each node in an undirected graph."""
+@_memoized
+def _in_degrees(graph):
+    """Return an array of in degrees for each node in the graph."""
+    degrees = np.bincount(graph.edges_dst, minlength=len(graph.nodes))
+    degrees = degrees.astype(_degree_dtype(graph))
+    _readonly(degrees)
+    return degrees
+
+@_memoized
+def _total_degrees(graph):
+    """Return an array of in plus out degrees for each node in the graph."""
+    degrees = _in_degrees(graph) + _degrees(graph)
+    _readonly(degrees)
+    return degrees
+
+def _as_dict(graph, degrees):
+    """Return a dictionary mapping each node in the graph to its degree."""
+    return dict(zip(graph.nodes, degrees.tolist()))
+
+def degrees_array(graph):
+    """Return an array of degrees for each node in an undirected graph."""
     if graph.is_directed:
         raise ValueError("Cannot call degrees() on a directed graph")
     return _degrees(graph)
 
-def out_degrees(graph):
-    """Return a dictionary of out degrees for each node in a directed graph."""
+def out_degrees_array(graph):
+    """Return an array of out degrees for each node in a directed graph."""
     if graph.is_directed:
         return _degrees(graph)
     raise ValueError("Cannot call out_degrees() on an undirected graph")
 
-def total_degrees(graph):
-    """Return a dictionary of total degrees for each node in a directed graph."""
+def total_degrees_array(graph):
+    """Return an array of total degrees for each node in a directed graph."""
     if not graph.is_directed:
         raise ValueError("Cannot call total_degrees() on an undirected graph")
     
-    undirected_graph = Graph(graph.nodes, graph.edges, is_directed=False)
-    return degrees(undirected_graph)
+    return _total_degrees(graph)
 
-def in_degrees(graph):
-    """Return a dictionary of in degrees for each node in a directed graph."""
+def in_degrees_array(graph):
+    """Return an array of in degrees for each node in a directed graph."""
     if not graph.is_directed:
         raise ValueError("Cannot call total_degrees() on an undirected graph.")
     
-    reversed_edges = [(node2, node1) for node1, node2 in graph.edges]
-    reversed_graph = Graph(graph.nodes, reversed_edges, is_directed=True) 
-    return out_degrees(reversed_graph)
+    return _in_degrees(graph)
+
+def degree_centrality(graph):
+    """
+    Return the out, in and total degree arrays of a directed graph,
+    computed as U @ 1 and U.T @ 1 for the adjacency matrix U.
+    """
+    if not graph.is_directed:
+        raise ValueError("Cannot call degree_centrality() on an undirected graph")
+
+    adj = _adjacency(graph)
+    ones = np.ones(len(graph.nodes), dtype=np.int32)
+    # Match the dtype of the other degree arrays.
+    dtype = _degree_dtype(graph)
+    out_degrees = (adj @ ones).astype(dtype)
+    in_degrees = (adj.T @ ones).astype(dtype)
+    return DegreeCentrality(out_degrees, in_degrees, out_degrees + in_degrees)
+
+@_memoized
+def _degree_stats(graph):
+    """Return the cached DegreeStats of the graph's degree array."""
+    degrees = _degrees(graph)
+    return DegreeStats(
+        int(degrees.min()), int(degrees.max()),
+        int(degrees.sum()), float(degrees.mean()),
+    )
+
+def degree_stats(graph):
+    """Return the minimum, maximum, sum and mean degree of an undirected graph."""
+    if graph.is_directed:
+        raise ValueError("Cannot call degree_stats() on a directed graph")
+    return _degree_stats(graph)
+
+def degrees(graph):
+    """Return a dictionary of degrees for each node in an undirected graph."""
+    return _as_dict(graph, degrees_array(graph))
+
+def out_degrees(graph):
+    """Return a dictionary of out degrees for each node in a directed graph."""
+    return _as_dict(graph, out_degrees_array(graph))
+
+def total_degrees(graph):
+    """Return a dictionary of total degrees for each node in a directed graph."""
+    return _as_dict(graph, total_degrees_array(graph))
+
+def in_degrees(graph):
+    """Return a dictionary of in degrees for each node in a directed graph."""
+    return _as_dict(graph, in_degrees_array(graph))
 
 def min_degree(graph):
     """Return minimum degree for an undirected graph."""
-    return min(degrees(graph).values())
+    return degree_stats(graph).min
 
 def min_out_degree(graph):
     """Return minimum out degree for a directed graph."""
-    return min(out_degrees(graph).values())
+    return int(out_degrees_array(graph).min())
 
 def min_in_degree(graph):
     """Return minimum in degree for a directed graph."""
-    return min(in_degrees(graph).values())
+    return int(in_degrees_array(graph).min())
 
 def min_total_degree(graph):
     """Return minimum total degree for a directed graph."""
-    return min(total_degrees(graph).values())
+    return int(total_degrees_array(graph).min())
 
 def max_degree(graph):
     """Return maximum degree for an undirected graph."""
-    return max(degrees(graph).values())
+    return degree_stats(graph).max
 
 def max_out_degree(graph):
     """Return maximum out degree for a directed graph."""
-    return max(out_degrees(graph).values())
+    return int(out_degrees_array(graph).max())
 
 def max_in_degree(graph):
     """Return maximum in degree for a directed graph."""
-    return max(in_degrees(graph).values())
+    return int(in_degrees_array(graph).max())
 
 def max_total_degree(graph):
     """Return maximum total degree for a directed graph."""
-    return max(total_degrees(graph).values())
\ No newline at end of file
+    return int(total_degrees_array(graph).max())
+
+def degrees_batch(graphs, degree_func=degrees_array, max_workers=None,
+                  processes=False):
+    """
+    Return [degree_func(graph) for graph in graphs], computed in a pool.
+
+    A thread pool is used by default, which avoids pickling graphs but
+    only overlaps work where degree_func releases the GIL. For the
+    dict-returning helpers such as degrees(), which spend most of their
+    time building Python dicts, pass processes=True to use a process
+    pool instead. For many small graphs the pool overhead outweighs the
+    work, and a plain list comprehension is faster than either.
+    """
+    executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with executor_class(max_workers=max_workers) as executor:
+        return list(executor.map(degree_func, graphs))
+
+if __name__ == "__main__":
+    nodes = range(4)
+    edges = [
+        (0, 1), 
+        (0, 1), 
+        (0, 2), 
+        (0, 2), 
+        (0, 3), 
+        (1, 3), 
+        (2, 3)]
+
+    edges_src, edges_dst = np.array(edges, dtype=np.int32).T.copy()
+    G = Graph(nodes, edges_src, edges_dst, True)
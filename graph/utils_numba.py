@@ -0,0 +1,23 @@
+"""
+Numba kernels for the hot paths in graph.py.
+
+numba is an optional extra and isn't listed in requirements.txt;
+install it with 'pip install numba' to enable these kernels. Without
+it graph.py falls back to its NumPy implementations.
+"""
+import numpy as np
+from numba import njit, prange
+
+@njit(parallel=True, cache=True)
+def fill_adjacency(indptr, indices, num_nodes):
+    """
+    Return the dense adjecency matrix of a graph given in CSR form.
+
+    Every row is filled by a single thread, so parallel edges can be
+    accumulated with a plain += without racing on the same cell.
+    """
+    adj = np.zeros((num_nodes, num_nodes), dtype=np.int32)
+    for node in prange(num_nodes):
+        for i in range(indptr[node], indptr[node + 1]):
+            adj[node, indices[i]] += 1
+    return adj
@@ -0,0 +1,184 @@
+import sys
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "graph"))
+
+import graph  # noqa: E402
+
+SAMPLE_EDGES = [(0, 1), (0, 1), (0, 2), (0, 2), (0, 3), (1, 3), (2, 3)]
+
+
+def reference_adjacency_dict(nodes, edges, is_directed):
+    """The original list-of-tuples adjacency_dict."""
+    adj = {node: [] for node in nodes}
+    for node1, node2 in edges:
+        adj[node1].append(node2)
+        if not is_directed:
+            adj[node2].append(node1)
+    return adj
+
+
+def reference_degrees(nodes, edges, is_directed):
+    return {
+        node: len(neighbors)
+        for node, neighbors in reference_adjacency_dict(nodes, edges, is_directed).items()
+    }
+
+
+def reference_edges(kind, n):
+    if kind == "path":
+        return [(i, i + 1) for i in range(n - 1)]
+    if kind == "cycle":
+        return [(i, i + 1) for i in range(n - 1)] + [(n - 1, 0)]
+    if kind == "complete":
+        return list(combinations(range(n), 2))
+    return [(0, i) for i in range(1, n)]
+
+
+def make_graph(nodes, edges, is_directed):
+    edges_src = [u for u, _ in edges]
+    edges_dst = [v for _, v in edges]
+    return graph.Graph(nodes, edges_src, edges_dst, is_directed)
+
+
+GENERATORS = {
+    "path": graph.path_graph,
+    "cycle": graph.cycle_graph,
+    "complete": graph.complete_graph,
+    "star": graph.star_graph,
+}
+
+
+@pytest.mark.parametrize("kind", sorted(GENERATORS))
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 9])
+def test_generators_match_baseline(kind, n):
+    g = GENERATORS[kind](n)
+    edges = reference_edges(kind, n)
+    assert list(zip(g.edges_src.tolist(), g.edges_dst.tolist())) == edges
+    assert graph.adjacency_dict(g) == reference_adjacency_dict(range(n), edges, False)
+    expected = reference_degrees(range(n), edges, False)
+    assert graph.degrees(g) == expected
+    assert graph.min_degree(g) == min(expected.values())
+    assert graph.max_degree(g) == max(expected.values())
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_sample_multigraph_matches_baseline(is_directed):
+    nodes = range(4)
+    edges = SAMPLE_EDGES + [(2, 2)]
+    g = make_graph(nodes, edges, is_directed)
+    assert graph.adjacency_dict(g) == reference_adjacency_dict(nodes, edges, is_directed)
+    if not is_directed:
+        assert graph.degrees(g) == reference_degrees(nodes, edges, False)
+        return
+
+    reversed_edges = [(v, u) for u, v in edges]
+    out_degrees = reference_degrees(nodes, edges, True)
+    in_degrees = reference_degrees(nodes, reversed_edges, True)
+    total_degrees = reference_degrees(nodes, edges, False)
+    assert graph.out_degrees(g) == out_degrees
+    assert graph.in_degrees(g) == in_degrees
+    assert graph.total_degrees(g) == total_degrees
+    assert graph.min_out_degree(g) == min(out_degrees.values())
+    assert graph.max_out_degree(g) == max(out_degrees.values())
+    assert graph.min_in_degree(g) == min(in_degrees.values())
+    assert graph.max_in_degree(g) == max(in_degrees.values())
+    assert graph.min_total_degree(g) == min(total_degrees.values())
+    assert graph.max_total_degree(g) == max(total_degrees.values())
+
+
+def test_directed_only_functions_reject_undirected_graphs():
+    g = graph.path_graph(3)
+    for func in (graph.out_degrees, graph.in_degrees, graph.total_degrees):
+        with pytest.raises(ValueError):
+            func(g)
+    with pytest.raises(ValueError):
+        graph.degrees(graph.path_graph(3, is_directed=True))
+
+
+def test_graph_copies_caller_edges():
+    edges_src = np.array([0, 1])
+    edges_dst = np.array([1, 2])
+    g = graph.Graph(range(3), edges_src, edges_dst, False)
+    assert graph.degrees(g) == {0: 1, 1: 2, 2: 1}
+    edges_src[0] = 2
+    assert graph.degrees(g) == {0: 1, 1: 2, 2: 1}
+    assert g.edges_src.dtype == np.int32
+    with pytest.raises(ValueError):
+        g.edges_src[0] = 2
+
+
+def test_degree_centrality_matches_degree_arrays():
+    g = make_graph(range(4), SAMPLE_EDGES, True)
+    centrality = graph.degree_centrality(g)
+    expected = (
+        graph.out_degrees_array(g),
+        graph.in_degrees_array(g),
+        graph.total_degrees_array(g),
+    )
+    for actual, wanted in zip(centrality, expected):
+        np.testing.assert_array_equal(actual, wanted)
+        assert actual.dtype == wanted.dtype
+
+
+def test_degree_arrays_are_cached_and_read_only():
+    g = make_graph(range(4), SAMPLE_EDGES, True)
+    for func in (graph.out_degrees_array, graph.in_degrees_array, graph.total_degrees_array):
+        degrees = func(g)
+        assert func(g) is degrees
+        with pytest.raises(ValueError):
+            degrees[0] = 0
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_dense_adjacency_matrix_matches_baseline(is_directed):
+    nodes = range(4)
+    edges = SAMPLE_EDGES + [(2, 2)]
+    expected = [[0] * len(nodes) for _ in nodes]
+    for node1, node2 in edges:
+        expected[node1][node2] += 1
+        if not is_directed:
+            expected[node2][node1] += 1
+    g = make_graph(nodes, edges, is_directed)
+    assert graph.adjacency_matrix(g, dense=True).tolist() == expected
+    assert graph.adjacency_matrix(g).toarray().tolist() == expected
+
+
+@pytest.mark.parametrize("g", [
+    graph.complete_graph(40),
+    graph.path_graph(300),
+    graph.cycle_graph(300, is_directed=True),
+])
+def test_dense_adjacency_matrix_matches_sparse(g):
+    dense = graph.adjacency_matrix(g, dense=True)
+    assert dense.dtype == np.int32
+    np.testing.assert_array_equal(dense, graph.adjacency_matrix(g).toarray())
+    one_sided = graph.adjacency_matrix(g, dense=True, symmetric=False)
+    np.testing.assert_array_equal(
+        one_sided, graph.adjacency_matrix(g, symmetric=False).toarray()
+    )
+
+
+def test_graph_from_lists_supports_every_representation():
+    g = make_graph(range(4), SAMPLE_EDGES, True)
+    assert g.edges_src.dtype == np.int32
+    expected = (graph.adjacency_matrix(g, dense=True) > 0).astype(np.uint8)
+    bits = graph.adjacency_bitset(g)
+    unpacked = np.unpackbits(bits.view(np.uint8), axis=1, bitorder="little")
+    np.testing.assert_array_equal(unpacked[:, :4], expected)
+
+
+def test_graph_with_warm_cache_pickles():
+    import pickle
+
+    g = graph.cycle_graph(5)
+    degrees = graph.degrees(g)
+    restored = pickle.loads(pickle.dumps(g))
+    assert restored._cache == {}
+    assert graph.degrees(restored) == degrees
+    with pytest.raises(ValueError):
+        restored.edges_src[0] = 1